@@ -1,39 +1,108 @@
-import requests
+from io import StringIO
+
+import httpx
+import ijson
+import orjson
 from django.core.management.base import BaseCommand
-from manager.models import Country, State, City
-from django.db import IntegrityError, transaction
+from manager.models import Country, State
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+
+IBGE_API_BASE = 'https://servicodados.ibge.gov.br/api/v1/localidades'
+STATES_URL = f'{IBGE_API_BASE}/estados?orderBy=nome'
+CITIES_URL = f'{IBGE_API_BASE}/municipios'
+
+# Process-level cache so repeated runs in the same worker skip the
+# get_or_create SELECT entirely.
+_country_cache = {}
+
+
+def get_country(code, name):
+    """Return the Country for ``code``, touching the DB at most once per process."""
+    country = _country_cache.get(code)
+    if country is None:
+        country, _ = Country.objects.get_or_create(code=code, defaults={'name': name})
+        _country_cache[code] = country
+    return country
+
+
+class _ChunkReader:
+    """Minimal file-like wrapper so ijson can read from an iterator of bytes."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
 
 
 class Command(BaseCommand):
-    help = 'Populates Country, State, and City tables for Brazil using the IBGE API with bulk operations.'
+    help = (
+        'Populates Country, State, and City tables for Brazil using the IBGE API '
+        'with bulk operations. Designed to run in its own process (one-off '
+        'container or cron), never inside the serving web process.'
+    )
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.NOTICE('Starting bulk population of geographical data...'))
 
+        # One timestamp for the city COPY stream, which bypasses the ORM and
+        # therefore must supply created_at/updated_at itself. The ORM paths
+        # keep their auto_now/auto_now_add handling.
+        now = timezone.now()
+
         # 1. Populating Country (Brazil)
         try:
-            brazil_country, created = Country.objects.get_or_create(
-                name="Brasil",
-                code="BRA"
-            )
-            if created:
-                self.stdout.write(self.style.SUCCESS('Successfully added Country: Brasil'))
-            else:
-                self.stdout.write(self.style.WARNING('Country: Brasil already exists. Skipping.'))
+            brazil_country = get_country('BRA', 'Brasil')
+            self.stdout.write(self.style.SUCCESS('Country ready: Brasil'))
         except IntegrityError:
             self.stdout.write(self.style.ERROR('Error creating Country: Brasil'))
             return
 
-        # 2. Populating States (from IBGE API)
-        states_url = 'https://servicodados.ibge.gov.br/api/v1/localidades/estados?orderBy=nome'
+        with httpx.Client(http2=True, timeout=30.0, headers={'Accept': 'application/json'}) as session:
+            # 2. Populating States (from IBGE API)
+            states_data = self.fetch_states(session)
+            if states_data is None:
+                return
+
+            state_ids = self.persist_states(states_data, brazil_country.pk)
+
+            # 3. Populating Cities (from IBGE API)
+            self.stdout.write(self.style.NOTICE('Populating cities...'))
+            buffer, city_count = self.fetch_city_rows(session, state_ids, now)
+            if buffer is None:
+                return
+
+        self.stdout.write(self.style.NOTICE(f'Found a total of {city_count} cities to populate.'))
+
+        created_count = self.persist_cities(buffer)
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully added {created_count} new cities.'))
+        self.stdout.write(self.style.SUCCESS('Geographical data population finished successfully!'))
+
+    def fetch_states(self, session):
+        """Fetch the state list from IBGE, or None on HTTP failure."""
         try:
-            response = requests.get(states_url)
+            response = session.get(STATES_URL)
             response.raise_for_status()
-            states_data = response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
             self.stdout.write(self.style.ERROR(f'Error fetching states from IBGE API: {e}'))
-            return
+            return None
 
+    def persist_states(self, states_data, country_id):
+        """Bulk-insert the states and return the abbreviation -> id mapping."""
         state_objects = []
         for state_data in states_data:
             state_objects.append(
@@ -41,41 +110,68 @@ class Command(BaseCommand):
                     name=state_data['nome'],
                     abbreviation=state_data['sigla'],
                     region=state_data['regiao']['nome'],
-                    country=brazil_country
+                    country_id=country_id
                 )
             )
 
         with transaction.atomic():
-            created_states = State.objects.bulk_create(state_objects, ignore_conflicts=True)
+            created_states = State.objects.bulk_create(state_objects, batch_size=1000, ignore_conflicts=True)
 
         self.stdout.write(self.style.SUCCESS(f'Successfully added {len(created_states)} new states.'))
 
-        # 3. Populating Cities (from IBGE API)
-        self.stdout.write(self.style.NOTICE('Populating cities... This may take a few minutes.'))
+        # ignore_conflicts disables RETURNING, so resolve the PKs with a single
+        # values_list query instead of re-materializing every State instance.
+        return dict(State.objects.values_list('abbreviation', 'id'))
 
-        all_cities_to_create = []
-        for state_obj in State.objects.all():
-            cities_url = f'https://servicodados.ibge.gov.br/api/v1/localidades/estados/{state_obj.abbreviation}/municipios'
-            try:
-                response = requests.get(cities_url)
+    def fetch_city_rows(self, session, state_ids, now):
+        """Stream the municipality payload into a COPY buffer.
+
+        One request for every municipality in the country, instead of 27
+        per-state round trips; each entry embeds its state metadata. The
+        response is parsed incrementally so the full JSON document is never
+        held in memory — COPY rows are written as entries arrive. Returns
+        (None, 0) on HTTP failure.
+        """
+        ts = now.isoformat()
+        buffer = StringIO()
+        city_count = 0
+        try:
+            with session.stream('GET', CITIES_URL) as response:
                 response.raise_for_status()
-                cities_data = response.json()
-            except requests.RequestException as e:
-                self.stdout.write(self.style.ERROR(f'Error fetching cities for {state_obj.name}: {e}'))
-                continue
-
-            for city_data in cities_data:
-                all_cities_to_create.append(
-                    City(
-                        name=city_data['nome'],
-                        state=state_obj
+                for city_data in ijson.items(_ChunkReader(response.iter_bytes()), 'item'):
+                    state_id = state_ids[city_data['microrregiao']['mesorregiao']['UF']['sigla']]
+                    # Escape the characters COPY's text format treats specially,
+                    # so an unusual municipality name cannot corrupt the stream.
+                    name = (
+                        city_data['nome']
+                        .replace('\\', '\\\\')
+                        .replace('\t', '\\t')
+                        .replace('\n', '\\n')
+                        .replace('\r', '\\r')
                     )
-                )
+                    buffer.write(f'{name}\t{state_id}\t{ts}\t{ts}\n')
+                    city_count += 1
+        except httpx.HTTPError as e:
+            self.stdout.write(self.style.ERROR(f'Error fetching cities from IBGE API: {e}'))
+            return None, 0
 
-        self.stdout.write(self.style.NOTICE(f'Found a total of {len(all_cities_to_create)} cities to populate.'))
+        buffer.seek(0)
+        return buffer, city_count
 
-        with transaction.atomic():
-            created_cities = City.objects.bulk_create(all_cities_to_create, ignore_conflicts=True)
-
-        self.stdout.write(self.style.SUCCESS(f'Successfully added {len(created_cities)} new cities.'))
-        self.stdout.write(self.style.SUCCESS('Geographical data population finished successfully!'))
\ No newline at end of file
+    def persist_cities(self, buffer):
+        """COPY the buffered city rows in and return the number inserted."""
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Clone only the four copied columns: LIKE would carry over the
+            # NOT NULL identity id column without its identity default,
+            # making every COPY abort with a not-null violation.
+            cursor.execute(
+                'CREATE TEMPORARY TABLE city_import ON COMMIT DROP AS '
+                'SELECT name, state_id, created_at, updated_at FROM city WITH NO DATA'
+            )
+            cursor.copy_expert('COPY city_import (name, state_id, created_at, updated_at) FROM STDIN', buffer)
+            cursor.execute(
+                'INSERT INTO city (name, state_id, created_at, updated_at) '
+                'SELECT name, state_id, created_at, updated_at FROM city_import '
+                'ON CONFLICT DO NOTHING'
+            )
+            return cursor.rowcount
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.17 on 2026-08-31 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0002_alter_user_email_appointment_appt_salon_dt_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='appointment',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='city',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='service',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=models.UniqueConstraint(fields=('professional', 'date_time'), name='uniq_appt_professional_dt'),
+        ),
+        migrations.AddConstraint(
+            model_name='city',
+            constraint=models.UniqueConstraint(fields=('name', 'state'), name='uniq_city_name_state'),
+        ),
+        migrations.AddConstraint(
+            model_name='service',
+            constraint=models.UniqueConstraint(fields=('salon', 'name'), name='uniq_service_salon_name'),
+        ),
+    ]
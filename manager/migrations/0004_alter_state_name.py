@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0003_alter_appointment_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='state',
+            name='name',
+            field=models.CharField(db_index=True, max_length=100, verbose_name='Nome do Estado'),
+        ),
+    ]
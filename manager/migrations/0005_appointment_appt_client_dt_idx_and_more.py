@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-31 14:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0004_alter_state_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['client', 'date_time'], name='appt_client_dt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['service', 'date_time'], name='appt_service_dt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['salon', 'status', 'date_time'], name='appt_salon_status_dt_idx'),
+        ),
+    ]
@@ -28,7 +28,7 @@ class Country(TimeStampedModel):
 
 class State(TimeStampedModel):
     """Model to represent a state."""
-    name = models.CharField(max_length=100, unique=True, verbose_name="Nome do Estado")
+    name = models.CharField(max_length=100, db_index=True, verbose_name="Nome do Estado")
     abbreviation = models.CharField(max_length=2, unique=True, verbose_name="Abreviação")
     region = models.CharField(max_length=100, verbose_name="Região")
     country = models.ForeignKey(Country, on_delete=models.CASCADE, related_name='states', verbose_name="País")
@@ -48,7 +48,9 @@ class City(TimeStampedModel):
     state = models.ForeignKey(State, on_delete=models.CASCADE, related_name='cities', verbose_name="Estado")
 
     class Meta:
-        unique_together = ('name', 'state')
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'state'], name='uniq_city_name_state'),
+        ]
         verbose_name = "Cidade"
         verbose_name_plural = "Cidades"
         db_table = "city"
@@ -139,6 +141,12 @@ class Salon(TimeStampedModel):
         db_table = "salon"
 
 
+class ProfessionalQuerySet(models.QuerySet):
+    def with_related(self):
+        """Preload user, salon and specialties for list rendering."""
+        return self.select_related('user', 'salon').prefetch_related('specialties')
+
+
 class Professional(TimeStampedModel):
     """Model to represent a professional working at a salon."""
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='professional_info',
@@ -150,6 +158,8 @@ class Professional(TimeStampedModel):
                                         verbose_name="Foto do Profissional")
     is_active = models.BooleanField(default=True, verbose_name="Ativo")
 
+    objects = ProfessionalQuerySet.as_manager()
+
     def __str__(self):
         return self.full_name
 
@@ -175,7 +185,9 @@ class Service(TimeStampedModel):
         verbose_name = "Serviço"
         verbose_name_plural = "Serviços"
         ordering = ['name']
-        unique_together = ('salon', 'name')
+        constraints = [
+            models.UniqueConstraint(fields=['salon', 'name'], name='uniq_service_salon_name'),
+        ]
         db_table = "service"
 
 
@@ -186,6 +198,14 @@ class AppointmentStatus(models.TextChoices):
     CANCELLED = "cancelled", "Cancelado"
 
 
+class AppointmentQuerySet(models.QuerySet):
+    def with_related(self):
+        """Preload the relations list endpoints render, avoiding N+1 SELECTs."""
+        return self.select_related(
+            'salon', 'client', 'professional__user', 'service'
+        ).prefetch_related('professional__specialties')
+
+
 class Appointment(TimeStampedModel):
     """Model for a client appointment."""
     salon = models.ForeignKey(Salon, on_delete=models.CASCADE, related_name='appointments', verbose_name="Salão")
@@ -199,6 +219,8 @@ class Appointment(TimeStampedModel):
     status = models.CharField(max_length=50, choices=AppointmentStatus.choices, default='pending',
                               verbose_name="Status", db_index=True)
 
+    objects = AppointmentQuerySet.as_manager()
+
     def __str__(self):
         return f"Agendamento de {self.client.username} em {self.date_time}"
 
@@ -206,5 +228,14 @@ class Appointment(TimeStampedModel):
         verbose_name = "Agendamento"
         verbose_name_plural = "Agendamentos"
         ordering = ['date_time']
-        unique_together = ('professional', 'date_time')
+        constraints = [
+            models.UniqueConstraint(fields=['professional', 'date_time'], name='uniq_appt_professional_dt'),
+        ]
+        indexes = [
+            models.Index(fields=['salon', 'date_time'], include=['status'], name='appt_salon_dt_idx'),
+            models.Index(fields=['professional', 'date_time', 'status'], name='appt_pro_dt_status_idx'),
+            models.Index(fields=['client', 'date_time'], name='appt_client_dt_idx'),
+            models.Index(fields=['service', 'date_time'], name='appt_service_dt_idx'),
+            models.Index(fields=['salon', 'status', 'date_time'], name='appt_salon_status_dt_idx'),
+        ]
         db_table = "appointment"